@@ -104,25 +104,22 @@ fi
 # Get the directory where this script is located
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 # Change to project root (three levels up from scripts/deploy/00_validate_prerequisites/)
-PROJECT_ROOT="$(cd "$SCRIPT_DIR/../../.." && pwd)"
-cd "$PROJECT_ROOT"
+# Resolve it from the cd itself rather than in a separate subshell
+cd "$SCRIPT_DIR/../../.."
+PROJECT_ROOT="$PWD"
 
 if [ "$JSON_OUTPUT" = false ]; then
   echo "Working from project root: $PROJECT_ROOT"
 fi
 
-# ============================================================================
-# Export Configuration Variables
-# ============================================================================
-
-# Export variables for use in library scripts
-export JSON_OUTPUT
-export CHECK_ONLY
-
 # ============================================================================
 # Load Library Functions
 # ============================================================================
 
+# Libraries are sourced into this shell, so they see JSON_OUTPUT and
+# CHECK_ONLY directly; they are not exported to keep the environment
+# handed to every az/docker/node child process unchanged
+
 # Get lib directory path
 LIB_DIR="$SCRIPT_DIR/lib"
 
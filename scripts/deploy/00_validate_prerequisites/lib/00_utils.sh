@@ -17,6 +17,9 @@
 #   - VALIDATION_ERRORS   : Counter for critical errors
 #   - VALIDATION_WARNINGS : Counter for warnings
 #   - JSON_OUTPUT         : Whether to output in JSON format
+#   - AZ_CLI_AVAILABLE    : Whether the Azure CLI is on PATH
+#   - BICEP_AVAILABLE     : Cached result of the Bicep CLI probe
+#   - AZ_LOGGED_IN        : Cached result of the Azure login check
 #
 
 # ============================================================================
@@ -27,19 +30,26 @@
 VALIDATION_ERRORS=0
 VALIDATION_WARNINGS=0
 
+# Cached probes, each filled in once per run:
+#   AZ_CLI_AVAILABLE, BICEP_AVAILABLE : set by check_cli_tools
+#   AZ_LOGGED_IN                      : set by check_azure_auth
+AZ_CLI_AVAILABLE=false
+BICEP_AVAILABLE=false
+AZ_LOGGED_IN=false
+
 # ============================================================================
 # Print Functions
 # ============================================================================
 
 # Print colored section header
 # Only prints if JSON_OUTPUT is false
+# Emitted as a single write so the block is never split by other output
 print_header() {
   if [ "${JSON_OUTPUT:-false}" = false ]; then
-    printf "\n"
-    printf "============================================================\n"
-    printf " %s\n" "$1"
-    printf "============================================================\n"
-    printf "\n"
+    printf "\n%s\n %s\n%s\n\n" \
+      "============================================================" \
+      "$1" \
+      "============================================================"
   fi
 }
 
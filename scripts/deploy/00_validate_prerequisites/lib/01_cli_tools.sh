@@ -15,6 +15,8 @@
 # Uses global variables from 00_utils.sh:
 #   - VALIDATION_ERRORS
 #   - VALIDATION_WARNINGS
+#   - AZ_CLI_AVAILABLE (set here, read by later checks)
+#   - BICEP_AVAILABLE (set here, read by later checks)
 #
 
 # ============================================================================
@@ -28,7 +30,9 @@ check_cli_tools() {
   print_header "Checking Command-Line Tools"
   
   # Azure CLI - CRITICAL
+  # Resolved once here; later checks read AZ_CLI_AVAILABLE and bail out early
   if command -v az >/dev/null 2>&1; then
+    AZ_CLI_AVAILABLE=true
     local az_version
     az_version=$(az version --query '"azure-cli"' -o tsv)
     print_success "Azure CLI: $az_version"
@@ -39,9 +43,17 @@ check_cli_tools() {
   fi
   
   # Bicep CLI - CRITICAL
-  if command -v az >/dev/null 2>&1 && az bicep version >/dev/null 2>&1; then
-    local bicep_version
-    bicep_version=$(az bicep version | grep -o 'version [0-9.]*' | cut -d' ' -f2)
+  # Probe once and cache the result; later checks reuse BICEP_AVAILABLE
+  # instead of spawning the (slow) Azure CLI again
+  local bicep_output=""
+  if [ "$AZ_CLI_AVAILABLE" = true ] && bicep_output=$(az bicep version 2>/dev/null); then
+    BICEP_AVAILABLE=true
+    # Extract the version with a bash regex rather than a grep | cut pipeline
+    local bicep_version=""
+    local bicep_version_regex='version ([0-9.]+)'
+    if [[ $bicep_output =~ $bicep_version_regex ]]; then
+      bicep_version=${BASH_REMATCH[1]}
+    fi
     print_success "Bicep CLI: $bicep_version"
   else
     print_error "Bicep CLI is not installed"
@@ -62,8 +74,10 @@ check_cli_tools() {
   
   # Docker - CRITICAL
   if command -v docker >/dev/null 2>&1; then
+    # "Docker version 24.0.5, build abc" -> "24.0.5" (parsed in-shell)
     local docker_version
-    docker_version=$(docker --version | cut -d' ' -f3 | tr -d ',')
+    read -r _ _ docker_version _ <<< "$(docker --version)"
+    docker_version=${docker_version%,}
     print_success "Docker: $docker_version"
     
     # Check if Docker daemon is running
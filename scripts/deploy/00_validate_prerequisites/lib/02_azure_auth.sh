@@ -11,6 +11,8 @@
 # Uses global variables from 00_utils.sh:
 #   - VALIDATION_ERRORS
 #   - VALIDATION_WARNINGS
+#   - AZ_CLI_AVAILABLE
+#   - AZ_LOGGED_IN (set here, read by later checks)
 #
 
 # ============================================================================
@@ -23,21 +25,26 @@
 check_azure_auth() {
   print_header "Checking Azure Authentication"
   
-  # Check if Azure CLI is installed first
-  if ! command -v az >/dev/null 2>&1; then
+  # Check if Azure CLI is installed first (resolved by check_cli_tools)
+  if [ "$AZ_CLI_AVAILABLE" != true ]; then
     print_error "Azure CLI not installed, skipping authentication check"
     return
   fi
   
-  # Check login status
-  if az account show >/dev/null 2>&1; then
+  # Check login status and fetch account info in a single call
+  # The result is cached in AZ_LOGGED_IN for the permission and provider checks
+  local account_info=""
+  if account_info=$(az account show --query "[name, id]" -o tsv 2>/dev/null); then
+    AZ_LOGGED_IN=true
     print_success "Logged in to Azure CLI"
     
-    # Get account info
-    local account_name
-    local subscription_id
-    account_name=$(az account show --query name -o tsv)
-    subscription_id=$(az account show --query id -o tsv)
+    # Split account info (list projection: name, then id, one per line)
+    local account_name=""
+    local subscription_id=""
+    {
+      read -r account_name || true
+      read -r subscription_id || true
+    } <<< "$account_info"
     
     print_info "Account: $account_name"
     print_info "Subscription: $subscription_id"
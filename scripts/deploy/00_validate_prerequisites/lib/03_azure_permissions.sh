@@ -8,6 +8,7 @@
 #   - Note about Contributor/Owner requirement for deployment
 #
 # Uses global variables from 00_utils.sh:
+#   - AZ_LOGGED_IN
 #   - VALIDATION_ERRORS
 #
 
@@ -20,8 +21,8 @@
 check_azure_permissions() {
   print_header "Checking Azure Permissions"
   
-  # Check if Azure CLI is installed and logged in
-  if ! command -v az >/dev/null 2>&1 || ! az account show >/dev/null 2>&1; then
+  # Reuse the login status determined by check_azure_auth
+  if [ "$AZ_LOGGED_IN" != true ]; then
     print_warning "Skipping permissions check (not logged in)"
     return
   fi
@@ -12,6 +12,7 @@
 # Uses global variables from 00_utils.sh:
 #   - VALIDATION_ERRORS
 #   - VALIDATION_WARNINGS
+#   - BICEP_AVAILABLE
 #
 
 # ============================================================================
@@ -29,7 +30,7 @@ check_required_files() {
     print_success "Phase 1 Bicep template found (main-foundation.bicep)"
     
     # Validate Bicep syntax if Bicep CLI is available
-    if command -v az >/dev/null 2>&1 && az bicep version >/dev/null 2>&1; then
+    if [ "$BICEP_AVAILABLE" = true ]; then
       if az bicep build --file infrastructure/bicep/main-foundation.bicep --stdout >/dev/null 2>&1; then
         print_success "Phase 1 Bicep template is valid"
       else
@@ -48,7 +49,7 @@ check_required_files() {
     print_success "Phase 2 Bicep template found (main-app.bicep)"
     
     # Validate Bicep syntax if Bicep CLI is available
-    if command -v az >/dev/null 2>&1 && az bicep version >/dev/null 2>&1; then
+    if [ "$BICEP_AVAILABLE" = true ]; then
       if az bicep build --file infrastructure/bicep/main-app.bicep --stdout >/dev/null 2>&1; then
         print_success "Phase 2 Bicep template is valid"
       else
@@ -12,6 +12,7 @@
 #   - Microsoft.Insights
 #
 # Uses global variables from 00_utils.sh:
+#   - AZ_LOGGED_IN
 #   - VALIDATION_WARNINGS
 #
 
@@ -25,8 +26,8 @@
 check_resource_providers() {
   print_header "Checking Azure Resource Providers"
   
-  # Check if Azure CLI is installed and logged in
-  if ! command -v az >/dev/null 2>&1 || ! az account show >/dev/null 2>&1; then
+  # Reuse the login status determined by check_azure_auth
+  if [ "$AZ_LOGGED_IN" != true ]; then
     print_warning "Skipping resource provider check (not logged in)"
     return
   fi
@@ -45,10 +46,37 @@ check_resource_providers() {
   
   local unregistered=()
   
+  # Fetch every provider's registration state in one call instead of one
+  # `az provider show` per namespace (each Azure CLI launch is slow)
+  local provider_states
+  provider_states=$(az provider list --query "[].[namespace, registrationState]" -o tsv 2>/dev/null || true)
+  
+  # Split the listing into parallel arrays once, stripping CRs (Git Bash)
+  # Indexed arrays and nocasematch keep this compatible with bash 3.2 (macOS)
+  local provider_names=()
+  local provider_values=()
+  local ns st
+  while IFS=$'\t' read -r ns st; do
+    [ -n "$ns" ] || continue
+    provider_names+=("$ns")
+    provider_values+=("${st%$'\r'}")
+  done <<< "$provider_states"
+  
+  # Namespaces are matched case-insensitively (Azure returns mixed casing)
+  local had_nocasematch=false
+  shopt -q nocasematch && had_nocasematch=true
+  shopt -s nocasematch
+  
   # Check each provider's registration status
   for provider in "${required_providers[@]}"; do
-    local state
-    state=$(az provider show --namespace "$provider" --query registrationState -o tsv 2>/dev/null || echo "Unknown")
+    local state="Unknown"
+    local i
+    for ((i = 0; i < ${#provider_names[@]}; i++)); do
+      if [[ ${provider_names[i]} == "$provider" ]]; then
+        state=${provider_values[i]:-Unknown}
+        break
+      fi
+    done
     
     if [ "$state" = "Registered" ]; then
       print_success "$provider: Registered"
@@ -58,6 +86,10 @@ check_resource_providers() {
     fi
   done
   
+  if [ "$had_nocasematch" = false ]; then
+    shopt -u nocasematch
+  fi
+  
   # Show registration commands if any providers are unregistered
   if [ ${#unregistered[@]} -gt 0 ]; then
     printf "\n"
@@ -30,7 +30,8 @@ check_environment() {
     
     # Check if version is 18 or higher
     local node_major
-    node_major=$(echo "$node_version" | grep -o 'v[0-9]*' | tr -d 'v')
+    node_major=${node_version#v}
+    node_major=${node_major%%.*}
     if [ "$node_major" -ge 18 ]; then
       print_success "Node.js version is 18+ (compatible)"
     else